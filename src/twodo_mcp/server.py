@@ -10,9 +10,14 @@ Requires macOS with 2Do app installed.
 """
 
 import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable
 from enum import Enum
-from typing import TypedDict
-from urllib.parse import quote
+from functools import lru_cache, partial
+from typing import Any, TypedDict, cast
+from urllib.parse import quote, quote_from_bytes, urlencode
+from uuid import uuid4
 
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import BaseModel, ConfigDict, Field
@@ -20,14 +25,68 @@ from pydantic import BaseModel, ConfigDict, Field
 # Initialize the MCP server
 mcp = FastMCP("twodo_mcp")
 
+# Prebound quote with an explicit safe set ('/' kept, matching urllib's
+# default) so per-call keyword resolution is skipped in the hot loops.
+_q = partial(quote, safe="/")
+# Memoized variant for short values that repeat across calls (list, project,
+# and tag names). Unbounded inputs — task titles, paste bodies, search text —
+# stay on the plain _q path so they can't churn the cache.
+_q_cached = lru_cache(maxsize=1024)(_q)
+
+# Characters that survive quote(safe="/") unchanged, plus the space. Typical
+# task titles and list names match, so encoding collapses to one replace().
+_PLAIN_RE = re.compile(r"[A-Za-z0-9_.~/ -]*")
+
+
+def _qfast(s: str, safe: str = "/", encoding: str | None = None, errors: str | None = None) -> str:
+    """quote() with a fast path for plain ASCII text.
+
+    Signature-compatible with quote so urlencode can use it as quote_via;
+    anything outside the plain set falls back to the real quote().
+    """
+    if _PLAIN_RE.fullmatch(s):
+        return s.replace(" ", "%20")
+    return quote(s, safe, encoding, errors)
+
+
 # Constants
 TWODO_BASE_URL = "twodo://x-callback-url"
-CLIPBOARD_WAIT_SECONDS = 0.5
-BATCH_DELAY_SECONDS = 0.3
+# Static view-navigation URLs, built once at import.
+_VIEW_URLS = {
+    "Today": TWODO_BASE_URL + "/showToday",
+    "Starred": TWODO_BASE_URL + "/showStarred",
+    "Scheduled": TWODO_BASE_URL + "/showScheduled",
+    "All": TWODO_BASE_URL + "/showAll",
+}
+# Prefixes for the single-argument navigation URLs, so the per-call work is
+# just one quote plus one concatenation.
+_URL_SHOWLIST_PREFIX = TWODO_BASE_URL + "/showList?name="
+_URL_SEARCH_PREFIX = TWODO_BASE_URL + "/search?text="
+_URL_ADD_TASK_PREFIX = TWODO_BASE_URL + "/add?task="
+_URL_PASTE_PREFIX = TWODO_BASE_URL + "/paste?text="
+# Escalating poll delays while waiting for 2Do to write the task UID to the
+# clipboard. Fast responses return after ~50ms; the total wait caps at ~1s.
+CLIPBOARD_POLL_DELAYS = (0.05, 0.075, 0.1, 0.15, 0.25, 0.4)
+# Batch adds dispatch concurrently; the short delay inside each worker keeps
+# the 2Do app from being flooded with URL events.
+BATCH_DISPATCH_DELAY_SECONDS = 0.05
+# Per-URL allowance in the bulk osascript timeout: each 'do shell script
+# "open ..."' takes a few hundred ms on top of the scripted delay.
+BULK_OPEN_SECONDS_PER_URL = 0.5
+DEFAULT_BATCH_CONCURRENCY = 4
+MAX_BATCH_CONCURRENCY = 8
+# Abort the remainder of a batch once this many adds fail back-to-back; a
+# broken 2Do install shouldn't cost 50 doomed dispatches.
+MAX_CONSECUTIVE_BATCH_FAILURES = 3
 URL_TIMEOUT_SECONDS = 10
 CLIPBOARD_TIMEOUT_SECONDS = 5
 TASK_UID_LENGTH = 32
 
+# 2Do task UIDs are 32 hex characters.
+_UID_RE = re.compile(r"[0-9a-fA-F]{32}")
+# Bound fullmatch, looked up once; the validation sites run inside poll loops.
+_is_uid = _UID_RE.fullmatch
+
 
 # ============================================================================
 # ENUMS
@@ -84,6 +143,25 @@ class BatchResult(TypedDict):
     results: list[BatchItemResult]
 
 
+class JobSubmitResult(TypedDict):
+    """Result from submitting a background batch job."""
+    success: bool
+    job_id: str
+    total: int
+
+
+class JobStatusResult(TypedDict):
+    """Progress snapshot of a background batch job."""
+    success: bool
+    job_id: str
+    done: bool
+    total: int
+    completed: int
+    successful: int
+    failed: int
+    results: list[BatchItemResult]
+
+
 class PasteResult(TypedDict):
     """Result from pasting tasks into a project."""
     success: bool
@@ -130,24 +208,183 @@ class ErrorResult(TypedDict):
 # ============================================================================
 
 async def _run_command(*args: str, timeout: float = URL_TIMEOUT_SECONDS) -> tuple[int, str, str]:
-    """Run a subprocess asynchronously and return (returncode, stdout, stderr)."""
+    """Run a subprocess asynchronously and return (returncode, stdout, stderr).
+
+    All children here are short-lived and inherit no sensitive descriptors,
+    so close_fds=False is safe and lets CPython spawn via posix_spawn,
+    avoiding Darwin's O(FD_MAX) descriptor-close loop on every fork.
+    """
     proc = await asyncio.create_subprocess_exec(
         *args,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
+        close_fds=False,
     )
-    stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        raise
     return proc.returncode or 0, stdout.decode().strip(), stderr.decode().strip()
 
 
+async def _run_command_rc(*args: str, timeout: float = URL_TIMEOUT_SECONDS) -> tuple[int, str]:
+    """Run a subprocess and return (returncode, stderr_on_failure).
+
+    Fast path for callers that ignore stdout ('open' in particular): no
+    stdout pipe is created and nothing is decoded on success; stderr is
+    read only when the command fails.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        close_fds=False,
+    )
+    try:
+        returncode = await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        raise
+    if returncode == 0:
+        return 0, ""
+    stderr = await proc.stderr.read() if proc.stderr is not None else b""
+    return returncode, stderr.decode().strip()
+
+
+class _Pacer:
+    """Async rate limiter that reserves dispatch slots on the monotonic clock.
+
+    Concurrent workers await wait() before dispatching; the lock-guarded slot
+    reservation keeps dispatches at least min_interval apart in aggregate, no
+    matter how many workers are in flight, and never blocks the event loop.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self._min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_allowed = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self._min_interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class _Launcher:
+    """Long-lived shell coprocess that opens URLs without a fork per call.
+
+    A single /bin/bash child runs a read loop: each URL written to its stdin
+    triggers one 'open' and one OK/ERR status line on stdout, so the fork/exec
+    cost is paid once per server instead of once per tool call. The child
+    exits on its own when the server does (EOF on stdin).
+    """
+
+    _SCRIPT = 'while IFS= read -r u; do if open "$u"; then echo OK; else echo "ERR:$?"; fi; done'
+
+    def __init__(self) -> None:
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+        self._broken = False
+
+    async def _ensure_started(self) -> bool:
+        if self._proc is not None and self._proc.returncode is None:
+            return True
+        if self._broken:
+            return False
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                "/bin/bash",
+                "-c",
+                self._SCRIPT,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                close_fds=False,
+            )
+        except (FileNotFoundError, OSError):
+            self._broken = True
+            return False
+        return True
+
+    async def open_url(self, url: str) -> tuple[bool, str] | None:
+        """Open a URL via the coprocess.
+
+        Returns:
+            (success, message), or None when the coprocess can't serve the
+            request and the caller should fall back to a one-shot 'open'.
+        """
+        async with self._lock:
+            if not await self._ensure_started():
+                return None
+            proc = self._proc
+            if proc is None or proc.stdin is None or proc.stdout is None:
+                return None
+            try:
+                proc.stdin.write(url.encode() + b"\n")
+                await proc.stdin.drain()
+            except (ConnectionResetError, BrokenPipeError, OSError):
+                # Write failed: the URL never reached the coprocess, so the
+                # one-shot fallback can't double-dispatch it.
+                proc.kill()
+                self._proc = None
+                return None
+            try:
+                line = await asyncio.wait_for(proc.stdout.readline(), timeout=URL_TIMEOUT_SECONDS)
+            except asyncio.CancelledError:
+                # Cancelled after the URL was written but before its status
+                # line was read: leaving the coprocess alive would desync
+                # every later request by one line, so drop it and let the
+                # next call start a fresh one.
+                proc.kill()
+                self._proc = None
+                raise
+            except asyncio.TimeoutError:
+                # The URL was already written, so its 'open' has almost
+                # certainly been exec'd and is hung, not unrun. Falling back
+                # would dispatch the URL a second time; report a hard result.
+                proc.kill()
+                self._proc = None
+                return False, "'open' timed out; outcome unknown"
+            except (ConnectionResetError, BrokenPipeError, OSError):
+                proc.kill()
+                self._proc = None
+                return None
+            if not line:
+                # Coprocess exited unexpectedly; let the caller retry via fork.
+                self._proc = None
+                return None
+            status = line.decode().strip()
+            if status == "OK":
+                return True, "OK"
+            if status == "ERR:127":
+                # 'open' itself is missing — not macOS. Stop using the
+                # coprocess so the fallback path reports the clearer error.
+                self._broken = True
+                return None
+            return False, f"'open' command failed: {status}"
+
+
+_LAUNCHER = _Launcher()
+
+
 async def _open_url(url: str) -> tuple[bool, str]:
-    """Open a URL scheme on macOS via the 'open' command.
+    """Open a URL scheme on macOS, preferring the long-lived launcher.
+
+    Falls back to forking a one-shot 'open' when the coprocess is unavailable.
 
     Returns:
         tuple[bool, str]: (success, message)
     """
+    result = await _LAUNCHER.open_url(url)
+    if result is not None:
+        return result
     try:
-        returncode, _, stderr = await _run_command("open", url)
+        returncode, stderr = await _run_command_rc("open", url)
         if returncode == 0:
             return True, "OK"
         return False, f"'open' command failed: {stderr}"
@@ -159,8 +396,149 @@ async def _open_url(url: str) -> tuple[bool, str]:
         return False, f"OS error: {e}"
 
 
+async def _open_urls_bulk(urls: list[str]) -> list[tuple[bool, str]] | None:
+    """Open many URL schemes in a single 'osascript' process.
+
+    Builds one AppleScript that issues every 'open' sequentially with a short
+    delay between them, amortizing the fork/exec cost over the whole batch.
+    Each open appends an OK/ERR status line that is parsed from stdout.
+
+    Returns:
+        One (success, message) tuple per URL, or None if osascript could not
+        run or produced unparseable output (callers fall back to per-URL opens).
+    """
+    lines = ['set out to ""']
+    for url in urls:
+        lines.append("try")
+        # URLs are percent-encoded, so embedding in quotes is safe.
+        lines.append(f'do shell script "open \'{url}\'"')
+        lines.append('set out to out & "OK" & linefeed')
+        lines.append("on error")
+        lines.append('set out to out & "ERR" & linefeed')
+        lines.append("end try")
+        lines.append(f"delay {BATCH_DISPATCH_DELAY_SECONDS}")
+    lines.append("return out")
+    script = "\n".join(lines)
+
+    timeout = URL_TIMEOUT_SECONDS + len(urls) * (
+        BATCH_DISPATCH_DELAY_SECONDS + BULK_OPEN_SECONDS_PER_URL
+    )
+    try:
+        returncode, stdout, _ = await _run_command("osascript", "-e", script, timeout=timeout)
+    except asyncio.TimeoutError:
+        # The killed osascript may already have opened some of the URLs, and
+        # its buffered status output died with it. Falling back here would
+        # re-dispatch — and duplicate — those tasks, so report a hard result.
+        return [(False, "Batch 'osascript' timed out; task outcome unknown")] * len(urls)
+    except (FileNotFoundError, OSError):
+        return None
+
+    statuses = stdout.splitlines()
+    if returncode != 0 or len(statuses) != len(urls):
+        return None
+    return [
+        (status == "OK", "OK" if status == "OK" else "'open' command failed in 2Do batch")
+        for status in statuses
+    ]
+
+
+# Poll schedule for the in-osascript UID wait: 20 x 50ms = 1s, matching the
+# budget of the Python-side CLIPBOARD_POLL_DELAYS loop.
+_UID_POLL_ATTEMPTS = 20
+_UID_POLL_DELAY = 0.05
+
+
+async def _open_url_and_read_uid(url: str, previous: str = "") -> tuple[bool, str | None] | None:
+    """Open a URL and wait for a task UID on the clipboard in one osascript.
+
+    Collapses the open / sleep / pbpaste sequence into a single subprocess:
+    the AppleScript opens the URL, then polls the clipboard natively until a
+    32-character value appears.
+
+    Args:
+        url: The x-callback-url to open.
+        previous: Clipboard content captured before the call; when it is
+            itself a UID, the script is told to skip it so a stale value
+            isn't returned.
+
+    Returns:
+        (True, uid-or-None) when the URL was opened, (False, None) when
+        osascript timed out after the open was issued (outcome unknown —
+        callers must not re-dispatch), or None when osascript is
+        unavailable and the caller should fall back to
+        _open_url + _read_task_uid.
+    """
+    condition = f"length of c is {TASK_UID_LENGTH}"
+    if _is_uid(previous):
+        condition += f' and c is not "{previous}"'
+    script = "\n".join(
+        (
+            f"do shell script \"open '{url}'\"",
+            f"repeat {_UID_POLL_ATTEMPTS} times",
+            "try",
+            "set c to (the clipboard as text)",
+            f"if {condition} then return c",
+            "end try",
+            f"delay {_UID_POLL_DELAY}",
+            "end repeat",
+            'return ""',
+        )
+    )
+    try:
+        returncode, stdout, _ = await _run_command("osascript", "-e", script)
+    except asyncio.TimeoutError:
+        # The script opens the URL before it starts polling, so on timeout
+        # the open was almost certainly issued; falling back would dispatch
+        # the URL a second time. Report a hard outcome instead.
+        return False, None
+    except (FileNotFoundError, OSError):
+        return None
+    if returncode != 0:
+        return None
+    uid = stdout.strip()
+    if uid and uid != previous and _is_uid(uid):
+        return True, uid
+    return True, None
+
+
+# Cached NSPasteboard handle: None = not yet probed, False = PyObjC absent.
+_PASTEBOARD: Any = None
+_PASTEBOARD_TYPE: str = ""
+
+
+def _get_pasteboard() -> Any:
+    """Return the cached general NSPasteboard, or None when PyObjC is absent.
+
+    PyObjC is an optional dependency; when installed, clipboard reads go
+    straight through the AppKit C API instead of forking 'pbpaste' per read.
+    """
+    global _PASTEBOARD, _PASTEBOARD_TYPE
+    if _PASTEBOARD is None:
+        try:
+            import AppKit  # type: ignore[import-not-found]
+        except ImportError:
+            _PASTEBOARD = False
+        else:
+            _PASTEBOARD = AppKit.NSPasteboard.generalPasteboard()
+            _PASTEBOARD_TYPE = AppKit.NSPasteboardTypeString
+    return _PASTEBOARD or None
+
+
+def _clipboard_change_count() -> int | None:
+    """Return the pasteboard's monotonic change counter, or None without PyObjC.
+
+    The counter advances whenever anything writes to the pasteboard, letting
+    poll loops skip string reads entirely while nothing has changed.
+    """
+    pb = _get_pasteboard()
+    return pb.changeCount() if pb is not None else None
+
+
 async def _get_clipboard() -> str:
-    """Read clipboard content on macOS via 'pbpaste'."""
+    """Read clipboard content, via NSPasteboard when available, else 'pbpaste'."""
+    pb = _get_pasteboard()
+    if pb is not None:
+        return pb.stringForType_(_PASTEBOARD_TYPE) or ""
     try:
         _, stdout, _ = await _run_command("pbpaste", timeout=CLIPBOARD_TIMEOUT_SECONDS)
         return stdout
@@ -168,16 +546,30 @@ async def _get_clipboard() -> str:
         return ""
 
 
-async def _read_task_uid() -> str | None:
+async def _read_task_uid(previous: str = "", change_count: int | None = None) -> str | None:
     """Wait for 2Do to write a task UID to the clipboard, then read it.
 
+    Polls with escalating delays so fast 2Do responses return quickly while
+    slow ones still succeed within the ~1s total budget.
+
+    Args:
+        previous: Clipboard content captured before the URL was dispatched,
+            so a stale UID already on the clipboard isn't mistaken for the
+            new one.
+        change_count: Pasteboard change counter captured before dispatch.
+            When available, polls skip the string read until the counter
+            has advanced.
+
     Returns:
-        The 32-character UID string, or None if not found.
+        The 32-character hex UID string, or None if not found.
     """
-    await asyncio.sleep(CLIPBOARD_WAIT_SECONDS)
-    clip = await _get_clipboard()
-    if clip and len(clip) == TASK_UID_LENGTH:
-        return clip
+    for delay in CLIPBOARD_POLL_DELAYS:
+        await asyncio.sleep(delay)
+        if change_count is not None and _clipboard_change_count() == change_count:
+            continue
+        clip = await _get_clipboard()
+        if clip and clip != previous and _is_uid(clip):
+            return clip
     return None
 
 
@@ -189,7 +581,6 @@ class AddTaskInput(BaseModel):
     """Input for adding a single task to 2Do."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
         extra="forbid",
     )
 
@@ -299,6 +690,23 @@ class AddMultipleTasksInput(BaseModel):
         default=None,
         description="Due date for all tasks ('YYYY-MM-DD' or days from today)",
     )
+    concurrency: int = Field(
+        default=DEFAULT_BATCH_CONCURRENCY,
+        description="Maximum number of tasks dispatched to 2Do at once",
+        ge=1,
+        le=MAX_BATCH_CONCURRENCY,
+    )
+
+
+class JobStatusInput(BaseModel):
+    """Input for polling a background batch job."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    job_id: str = Field(
+        ...,
+        description="Job ID returned by twodo_add_multiple_tasks_submit",
+        min_length=1,
+    )
 
 
 class PasteTasksInput(BaseModel):
@@ -366,42 +774,80 @@ class SearchInput(BaseModel):
 # URL BUILDER
 # ============================================================================
 
-def _build_add_url(params: AddTaskInput) -> str:
-    """Build the 2Do URL scheme for adding a task."""
-    parts: list[str] = [f"task={quote(params.task)}"]
-
-    field_map: list[tuple[str, object, str]] = [
-        ("type", params.task_type if params.task_type != TaskType.TASK else None, "value"),
-        ("forlist", params.for_list, "quote"),
-        ("note", params.note, "quote"),
-        ("subtasks", params.subtasks, "quote"),
-        ("priority", params.priority if params.priority != Priority.NONE else None, "value"),
-        ("starred", "1" if params.starred else None, "raw"),
-        ("tags", params.tags, "quote"),
-        ("due", params.due, "quote"),
-        ("dueTime", params.due_time, "quote"),
-        ("start", params.start, "quote"),
-        ("repeat", params.repeat, "value"),
-        ("action", params.action, "quote"),
-        ("forParentName", params.for_parent_name, "quote"),
-        ("forParentTask", params.for_parent_task, "quote"),
-        ("locations", params.locations, "quote"),
-        ("ignoreDefaults", "1" if params.ignore_defaults else None, "raw"),
-        ("saveInClipboard", "1" if params.save_in_clipboard else None, "raw"),
-        ("edit", "1" if params.edit else None, "raw"),
-    ]
+# Wire strings per enum member, resolved once at import so the encoder does a
+# dict lookup instead of a .value descriptor read per URL. Members that mean
+# "use the default" map to None and are omitted from the URL.
+_TASK_TYPE_STR: dict[TaskType, str | None] = {m: m.value for m in TaskType}
+_TASK_TYPE_STR[TaskType.TASK] = None
+_PRIORITY_STR: dict[Priority, str | None] = {m: m.value for m in Priority}
+_PRIORITY_STR[Priority.NONE] = None
+_REPEAT_STR: dict[RepeatInterval | None, str | None] = {m: m.value for m in RepeatInterval}
+_REPEAT_STR[None] = None
+_BOOL_STR: dict[bool, str | None] = {True: "1", False: None}
+
+# Per-field URL descriptors, built once at import: (url_key, model_field,
+# wire_map). wire_map translates the raw field value to its query-string
+# form (None meaning "omit"); a wire_map of None passes strings through,
+# where an unset optional field is already None.
+_ADD_URL_FIELDS: tuple[tuple[str, str, dict[Any, str | None] | None], ...] = (
+    ("type", "task_type", _TASK_TYPE_STR),
+    ("forlist", "for_list", None),
+    ("note", "note", None),
+    ("subtasks", "subtasks", None),
+    ("priority", "priority", _PRIORITY_STR),
+    ("starred", "starred", _BOOL_STR),
+    ("tags", "tags", None),
+    ("due", "due", None),
+    ("dueTime", "due_time", None),
+    ("start", "start", None),
+    ("repeat", "repeat", _REPEAT_STR),
+    ("action", "action", None),
+    ("forParentName", "for_parent_name", None),
+    ("forParentTask", "for_parent_task", None),
+    ("locations", "locations", None),
+    ("ignoreDefaults", "ignore_defaults", _BOOL_STR),
+    ("saveInClipboard", "save_in_clipboard", _BOOL_STR),
+    ("edit", "edit", _BOOL_STR),
+)
 
-    for key, val, mode in field_map:
-        if val is None:
-            continue
-        if mode == "value":
-            parts.append(f"{key}={val.value}")
-        elif mode == "quote":
-            parts.append(f"{key}={quote(str(val))}")
-        else:
-            parts.append(f"{key}={val}")
 
-    return f"{TWODO_BASE_URL}/add?{'&'.join(parts)}"
+def _build_add_url_tail(params: AddMultipleTasksInput) -> str:
+    """Build the query-string tail shared by every task in a batch add.
+
+    Everything except 'task=' is identical across a batch, so the tail is
+    encoded once instead of once per title.
+    """
+    parts: list[str] = []
+    if params.for_list is not None:
+        parts.append(f"forlist={_q_cached(params.for_list)}")
+    priority = _PRIORITY_STR[params.priority]
+    if priority is not None:
+        parts.append("priority=" + priority)
+    if params.tags is not None:
+        parts.append(f"tags={_q_cached(params.tags)}")
+    if params.due is not None:
+        parts.append(f"due={_q_cached(params.due)}")
+    return "&".join(parts)
+
+
+def _build_add_url(params: AddTaskInput) -> str:
+    """Build the 2Do URL scheme for adding a task."""
+    # Read the model's field store once; 18 dict subscripts beat 18 trips
+    # through pydantic's attribute machinery.
+    fields = params.__dict__
+    pairs: list[tuple[str, str]] = [("task", fields["task"])]
+    append = pairs.append
+    for key, field, wire_map in _ADD_URL_FIELDS:
+        value = fields[field]
+        if wire_map is not None:
+            value = wire_map[value]
+        if value is not None:
+            append((key, value))
+    # urlencode drives the quote/join loop in C; safe='/' matches quote()'s
+    # default so the encoded output is unchanged.
+    # cast: _qfast's optional-encoding defaults don't match typeshed's
+    # _QuoteVia protocol, but urlencode only ever passes (string, safe).
+    return f"{TWODO_BASE_URL}/add?" + urlencode(pairs, safe="/", quote_via=cast(Any, _qfast))
 
 
 # ============================================================================
@@ -450,13 +896,34 @@ async def twodo_add_task(params: AddTaskInput) -> TaskResult | ErrorResult:
         TaskResult on success with {success, task, list, uid},
         or ErrorResult on failure with {success: false, error}.
     """
+    previous = await _get_clipboard() if params.save_in_clipboard else ""
+    change_count = _clipboard_change_count() if params.save_in_clipboard else None
     url = _build_add_url(params)
-    success, message = await _open_url(url)
 
+    if params.save_in_clipboard:
+        outcome = await _open_url_and_read_uid(url, previous)
+        if outcome is not None:
+            opened, uid = outcome
+            if not opened:
+                return ErrorResult(
+                    success=False,
+                    error=(
+                        "'osascript' timed out; the task may or may not have "
+                        "been created — check 2Do before retrying"
+                    ),
+                )
+            return TaskResult(
+                success=True,
+                task=params.task,
+                list=params.for_list or "(default)",
+                uid=uid,
+            )
+
+    success, message = await _open_url(url)
     if not success:
         return ErrorResult(success=False, error=message)
 
-    uid = await _read_task_uid() if params.save_in_clipboard else None
+    uid = await _read_task_uid(previous, change_count) if params.save_in_clipboard else None
     return TaskResult(
         success=True,
         task=params.task,
@@ -465,6 +932,100 @@ async def twodo_add_task(params: AddTaskInput) -> TaskResult | ErrorResult:
     )
 
 
+async def _dispatch_batch(
+    params: AddMultipleTasksInput,
+    report_progress: Callable[[int, int], Awaitable[None]],
+    results: list[BatchItemResult] | None = None,
+) -> tuple[list[BatchItemResult], int]:
+    """Dispatch a batch of add-task URLs and collect per-item results.
+
+    Shared by the blocking twodo_add_multiple_tasks tool and background
+    batch jobs; report_progress is awaited with (completed, total) as
+    tasks finish. When results is provided it is used as the output list,
+    so callers holding a reference (the job registry) observe items as
+    they complete. Returns (results, successful) so callers don't rescan
+    the result list just to count successes.
+    """
+    if results is None:
+        results = []
+    total = len(params.tasks)
+    # The shared fields were already validated on params; per-title URL
+    # construction reduces to one quote call and one concatenation.
+    tail = _build_add_url_tail(params)
+    suffix = f"&{tail}" if tail else ""
+    urls = [_URL_ADD_TASK_PREFIX + _qfast(task_title) + suffix for task_title in params.tasks]
+
+    statuses = await _open_urls_bulk(urls)
+    if statuses is not None:
+        await report_progress(total, total)
+        successful = sum(1 for ok, _ in statuses if ok)
+        results.extend(
+            BatchItemResult(task=task_title, success=ok, error=None if ok else msg)
+            for task_title, (ok, msg) in zip(params.tasks, statuses, strict=True)
+        )
+    else:
+        # osascript unavailable — fall back to bounded concurrent opens,
+        # aborting the remainder once failures start stacking up.
+        semaphore = asyncio.Semaphore(params.concurrency)
+        pacer = _Pacer(BATCH_DISPATCH_DELAY_SECONDS)
+
+        async def _open_one(index: int) -> tuple[int, bool, str]:
+            async with semaphore:
+                await pacer.wait()
+                ok, msg = await _open_url(urls[index])
+            return index, ok, msg
+
+        tasks = [asyncio.create_task(_open_one(i)) for i in range(total)]
+        successful = 0
+        done_indexes: set[int] = set()
+        consecutive_failures = 0
+        for future in asyncio.as_completed(tasks):
+            index, ok, msg = await future
+            done_indexes.add(index)
+            successful += ok
+            consecutive_failures = 0 if ok else consecutive_failures + 1
+            results.append(
+                BatchItemResult(task=params.tasks[index], success=ok, error=None if ok else msg)
+            )
+            await report_progress(len(results), total)
+            if consecutive_failures >= MAX_CONSECUTIVE_BATCH_FAILURES:
+                break
+
+        if len(done_indexes) < total:
+            for task in tasks:
+                task.cancel()
+            # Workers that finished before the abort (resolved but not yet
+            # yielded by as_completed) carry real dispatch outcomes — report
+            # those instead of mislabeling them as failures.
+            for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(outcome, BaseException):
+                    continue
+                index, ok, msg = outcome
+                if index in done_indexes:
+                    continue
+                done_indexes.add(index)
+                successful += ok
+                results.append(
+                    BatchItemResult(
+                        task=params.tasks[index], success=ok, error=None if ok else msg
+                    )
+                )
+            results.extend(
+                BatchItemResult(
+                    task=params.tasks[i],
+                    success=False,
+                    error=(
+                        "Batch aborted after repeated consecutive failures; "
+                        "task not dispatched (outcome unknown)"
+                    ),
+                )
+                for i in range(total)
+                if i not in done_indexes
+            )
+
+    return results, successful
+
+
 @mcp.tool(
     name="twodo_add_multiple_tasks",
     annotations={
@@ -481,8 +1042,9 @@ async def twodo_add_multiple_tasks(
 ) -> BatchResult:
     """Create multiple tasks in 2Do with shared settings.
 
-    Each task is created sequentially with a short delay between them
-    to avoid overwhelming the app. Reports progress to the client.
+    Tasks are dispatched concurrently under a bounded concurrency cap, with
+    a short delay inside each worker so the 2Do app isn't flooded with URL
+    events. Reports progress to the client as tasks complete.
 
     Args:
         params (AddMultipleTasksInput): Validated input containing:
@@ -491,38 +1053,129 @@ async def twodo_add_multiple_tasks(
             - priority (Priority): Shared priority level
             - tags (str|None): Shared comma-separated tags
             - due (str|None): Shared due date
+            - concurrency (int): Max tasks dispatched at once (1-8)
         ctx (Context): MCP context for progress reporting.
 
     Returns:
         BatchResult with {success, total, successful, failed, results[]}.
     """
-    results: list[BatchItemResult] = []
+    results, successful = await _dispatch_batch(params, ctx.report_progress)
     total = len(params.tasks)
+    return BatchResult(
+        success=successful == total,
+        total=total,
+        successful=successful,
+        failed=total - successful,
+        results=results,
+    )
 
-    for i, task_title in enumerate(params.tasks):
-        await ctx.report_progress(i, total)
 
-        task_input = AddTaskInput(
-            task=task_title,
-            for_list=params.for_list,
-            priority=params.priority,
-            tags=params.tags,
-            due=params.due,
-            save_in_clipboard=False,
-        )
-        url = _build_add_url(task_input)
-        ok, msg = await _open_url(url)
-        results.append(BatchItemResult(task=task_title, success=ok, error=None if ok else msg))
-        await asyncio.sleep(BATCH_DELAY_SECONDS)
+# In-memory registry of background batch jobs, keyed by job ID. Each entry
+# holds the running asyncio task plus the fields served by twodo_job_status.
+_JOBS: dict[str, dict[str, Any]] = {}
+# Finished jobs are kept around for late status polls, but only this many;
+# submissions evict the oldest finished entries beyond the cap so the
+# registry can't grow without bound over the life of the server.
+MAX_FINISHED_JOBS = 32
 
-    await ctx.report_progress(total, total)
 
+def _prune_jobs() -> None:
+    """Evict the oldest finished jobs once they exceed MAX_FINISHED_JOBS.
+
+    Running jobs are never evicted; dict insertion order makes the first
+    finished entries the oldest submissions.
+    """
+    finished = [job_id for job_id, job in _JOBS.items() if job["done"]]
+    for job_id in finished[: len(finished) - MAX_FINISHED_JOBS]:
+        del _JOBS[job_id]
+
+
+@mcp.tool(
+    name="twodo_add_multiple_tasks_submit",
+    annotations={
+        "title": "Submit Batch Add as Background Job",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False,
+    },
+)
+async def twodo_add_multiple_tasks_submit(params: AddMultipleTasksInput) -> JobSubmitResult:
+    """Submit a batch add as a background job and return immediately.
+
+    Unlike twodo_add_multiple_tasks, this does not block the client while
+    the batch runs, so large batches can't hit client timeouts. Poll
+    twodo_job_status with the returned job ID for progress and results;
+    finished jobs stay pollable until enough newer jobs finish to push
+    them past the registry cap.
+
+    Args:
+        params (AddMultipleTasksInput): Same input as twodo_add_multiple_tasks.
+
+    Returns:
+        JobSubmitResult with {success, job_id, total}.
+    """
+    _prune_jobs()
+    job_id = uuid4().hex
+    job: dict[str, Any] = {
+        "total": len(params.tasks),
+        "completed": 0,
+        "done": False,
+        "results": [],
+    }
+    _JOBS[job_id] = job
+
+    async def _report(completed: int, total: int) -> None:
+        job["completed"] = completed
+
+    async def _run() -> None:
+        try:
+            await _dispatch_batch(params, _report, job["results"])
+        finally:
+            job["completed"] = len(job["results"])
+            job["done"] = True
+
+    job["task"] = asyncio.create_task(_run())
+    return JobSubmitResult(success=True, job_id=job_id, total=job["total"])
+
+
+@mcp.tool(
+    name="twodo_job_status",
+    annotations={
+        "title": "Get Batch Job Status",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def twodo_job_status(params: JobStatusInput) -> JobStatusResult | ErrorResult:
+    """Get the status of a background batch job.
+
+    Args:
+        params (JobStatusInput): Validated input containing:
+            - job_id (str): ID returned by twodo_add_multiple_tasks_submit
+
+    Returns:
+        JobStatusResult with {success, job_id, done, total, completed,
+        successful, failed, results[]}, or ErrorResult for unknown IDs.
+    """
+    job = _JOBS.get(params.job_id)
+    if job is None:
+        return ErrorResult(success=False, error=f"Unknown job ID '{params.job_id}'")
+
+    # The job's result list is filled in as items complete, so a mid-flight
+    # poll sees real per-item outcomes, not an empty list.
+    results: list[BatchItemResult] = job["results"]
     successful = sum(1 for r in results if r["success"])
-    return BatchResult(
-        success=successful == total,
-        total=total,
+    return JobStatusResult(
+        success=True,
+        job_id=params.job_id,
+        done=job["done"],
+        total=job["total"],
+        completed=job["completed"],
         successful=successful,
-        failed=total - successful,
+        failed=len(results) - successful,
         results=results,
     )
 
@@ -553,18 +1206,27 @@ async def twodo_paste_tasks(params: PasteTasksInput) -> PasteResult | ErrorResul
         PasteResult on success with {success, project, list, tasks_added},
         or ErrorResult on failure.
     """
-    url = (
-        f"{TWODO_BASE_URL}/paste?"
-        f"text={quote(params.text)}"
-        f"&inProject={quote(params.in_project)}"
-        f"&forList={quote(params.for_list)}"
+    # The paste body is the one multi-KB value in the server; encoding the
+    # bytes directly skips quote()'s str wrapper, and the short project/list
+    # names stay on the memoized path.
+    url = "".join(
+        (
+            _URL_PASTE_PREFIX,
+            quote_from_bytes(params.text.encode(), safe="/"),
+            "&inProject=",
+            _q_cached(params.in_project),
+            "&forList=",
+            _q_cached(params.for_list),
+        )
     )
     ok, msg = await _open_url(url)
 
     if not ok:
         return ErrorResult(success=False, error=msg)
 
-    task_count = len([line for line in params.text.split("\n") if line.strip()])
+    # isspace() avoids allocating a stripped copy of every line just to
+    # test emptiness; pastes can run to thousands of lines.
+    task_count = sum(1 for line in params.text.splitlines() if line and not line.isspace())
     return PasteResult(
         success=True,
         project=params.in_project,
@@ -599,18 +1261,28 @@ async def twodo_get_task_id(params: GetTaskIDInput) -> TaskIDResult | ErrorResul
         TaskIDResult on success with {success, task, list, uid},
         or ErrorResult on failure.
     """
+    previous = await _get_clipboard()
+    change_count = _clipboard_change_count()
     url = (
         f"{TWODO_BASE_URL}/getTaskID?"
-        f"task={quote(params.task)}"
-        f"&forList={quote(params.for_list)}"
+        f"task={_q(params.task)}"
+        f"&forList={_q_cached(params.for_list)}"
         f"&saveInClipboard=1"
     )
-    ok, msg = await _open_url(url)
-
-    if not ok:
-        return ErrorResult(success=False, error=msg)
+    outcome = await _open_url_and_read_uid(url, previous)
+    if outcome is not None:
+        opened, uid = outcome
+        if not opened:
+            return ErrorResult(
+                success=False,
+                error="'osascript' timed out while looking up the task UID",
+            )
+    else:
+        ok, msg = await _open_url(url)
+        if not ok:
+            return ErrorResult(success=False, error=msg)
+        uid = await _read_task_uid(previous, change_count)
 
-    uid = await _read_task_uid()
     if not uid:
         return ErrorResult(
             success=False,
@@ -644,99 +1316,62 @@ async def twodo_show_list(params: ShowListInput) -> ListResult | ErrorResult:
     Returns:
         ListResult on success, or ErrorResult on failure.
     """
-    url = f"{TWODO_BASE_URL}/showList?name={quote(params.name)}"
+    url = _URL_SHOWLIST_PREFIX + _q_cached(params.name)
     ok, msg = await _open_url(url)
     if not ok:
         return ErrorResult(success=False, error=msg)
     return ListResult(success=True, list=params.name)
 
 
-@mcp.tool(
-    name="twodo_show_today",
-    annotations={
-        "title": "Show Today View",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": False,
-    },
-)
-async def twodo_show_today() -> ViewResult | ErrorResult:
-    """Navigate to the Today view in the 2Do app.
+# Success payloads for the view tools are fixed two-key dicts, so they are
+# built once at import; only the failure branch allocates per call.
+_VIEW_OK = {view: ViewResult(success=True, view=view) for view in _VIEW_URLS}
 
-    Returns:
-        ViewResult on success, or ErrorResult on failure.
-    """
-    ok, msg = await _open_url(f"{TWODO_BASE_URL}/showToday")
+
+async def _show_view(view: str) -> ViewResult | ErrorResult:
+    """Open one of the precomputed 2Do view URLs and build the response."""
+    ok, msg = await _open_url(_VIEW_URLS[view])
     if not ok:
         return ErrorResult(success=False, error=msg)
-    return ViewResult(success=True, view="Today")
+    return _VIEW_OK[view]
 
 
-@mcp.tool(
-    name="twodo_show_starred",
-    annotations={
-        "title": "Show Starred View",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": False,
-    },
-)
-async def twodo_show_starred() -> ViewResult | ErrorResult:
-    """Navigate to the Starred view in the 2Do app.
+def _make_view_tool(tool_name: str, title: str, view: str) -> Any:
+    """Create and register one view-navigation tool that delegates to _show_view.
 
-    Returns:
-        ViewResult on success, or ErrorResult on failure.
+    The four show-view tools are identical except for the view they open, so
+    they are generated from _VIEW_URLS keys instead of four copies of the
+    same function body.
     """
-    ok, msg = await _open_url(f"{TWODO_BASE_URL}/showStarred")
-    if not ok:
-        return ErrorResult(success=False, error=msg)
-    return ViewResult(success=True, view="Starred")
 
+    async def tool() -> ViewResult | ErrorResult:
+        return await _show_view(view)
 
-@mcp.tool(
-    name="twodo_show_scheduled",
-    annotations={
-        "title": "Show Scheduled View",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": False,
-    },
-)
-async def twodo_show_scheduled() -> ViewResult | ErrorResult:
-    """Navigate to the Scheduled view in the 2Do app.
+    tool.__name__ = tool_name
+    tool.__qualname__ = tool_name
+    tool.__doc__ = (
+        f"""Navigate to the {view} view in the 2Do app.
 
     Returns:
         ViewResult on success, or ErrorResult on failure.
     """
-    ok, msg = await _open_url(f"{TWODO_BASE_URL}/showScheduled")
-    if not ok:
-        return ErrorResult(success=False, error=msg)
-    return ViewResult(success=True, view="Scheduled")
-
+    )
+    return mcp.tool(
+        name=tool_name,
+        annotations={
+            "title": title,
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )(tool)
 
-@mcp.tool(
-    name="twodo_show_all",
-    annotations={
-        "title": "Show All Tasks View",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": False,
-    },
-)
-async def twodo_show_all() -> ViewResult | ErrorResult:
-    """Navigate to the All Tasks view in the 2Do app.
 
-    Returns:
-        ViewResult on success, or ErrorResult on failure.
-    """
-    ok, msg = await _open_url(f"{TWODO_BASE_URL}/showAll")
-    if not ok:
-        return ErrorResult(success=False, error=msg)
-    return ViewResult(success=True, view="All")
+twodo_show_today = _make_view_tool("twodo_show_today", "Show Today View", "Today")
+twodo_show_starred = _make_view_tool("twodo_show_starred", "Show Starred View", "Starred")
+twodo_show_scheduled = _make_view_tool("twodo_show_scheduled", "Show Scheduled View", "Scheduled")
+twodo_show_all = _make_view_tool("twodo_show_all", "Show All Tasks View", "All")
 
 
 @mcp.tool(
@@ -764,7 +1399,7 @@ async def twodo_search(params: SearchInput) -> SearchResult | ErrorResult:
         SearchResult on success (results shown in app, not returned here),
         or ErrorResult on failure.
     """
-    url = f"{TWODO_BASE_URL}/search?text={quote(params.text)}"
+    url = _URL_SEARCH_PREFIX + _q(params.text)
     ok, msg = await _open_url(url)
 
     if not ok:
@@ -5,11 +5,14 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from twodo_mcp.server import (
+    AddMultipleTasksInput,
     AddTaskInput,
     GetTaskIDInput,
     PasteTasksInput,
     SearchInput,
     ShowListInput,
+    _read_task_uid,
+    twodo_add_multiple_tasks,
     twodo_add_task,
     twodo_get_task_id,
     twodo_paste_tasks,
@@ -21,11 +24,36 @@ from twodo_mcp.server import (
     twodo_show_today,
 )
 
+FAKE_UID = "0123456789abcdef0123456789abcdef"
+
+
+@pytest.fixture
+def fast_poll():
+    """Shrink the clipboard poll delays so polling tests run instantly."""
+    with patch("twodo_mcp.server.CLIPBOARD_POLL_DELAYS", (0, 0, 0)):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def mock_osascript_unavailable():
+    """Mock the combined osascript open+read as unavailable.
+
+    Keeps tool tests on the _open_url/_read_task_uid path, where the
+    existing fixtures control the outcome (and nothing is really opened
+    when the suite runs on macOS).
+    """
+    with patch(
+        "twodo_mcp.server._open_url_and_read_uid", new_callable=AsyncMock, return_value=None
+    ) as m:
+        yield m
+
 
 @pytest.fixture
 def mock_open_url_success():
     """Mock _open_url to always succeed."""
-    with patch("twodo_mcp.server._open_url", new_callable=AsyncMock, return_value=(True, "OK")) as m:
+    with patch(
+        "twodo_mcp.server._open_url", new_callable=AsyncMock, return_value=(True, "OK")
+    ) as m:
         yield m
 
 
@@ -55,6 +83,59 @@ def mock_clipboard_empty():
         yield m
 
 
+class TestReadTaskUid:
+    """Tests for the adaptive clipboard polling in _read_task_uid."""
+
+    @pytest.mark.asyncio
+    async def test_returns_uid_on_first_hit(self, fast_poll) -> None:
+        with patch(
+            "twodo_mcp.server._get_clipboard", new_callable=AsyncMock, return_value=FAKE_UID
+        ):
+            assert await _read_task_uid() == FAKE_UID
+
+    @pytest.mark.asyncio
+    async def test_returns_uid_on_later_poll(self, fast_poll) -> None:
+        with patch(
+            "twodo_mcp.server._get_clipboard",
+            new_callable=AsyncMock,
+            side_effect=["", "", FAKE_UID],
+        ):
+            assert await _read_task_uid() == FAKE_UID
+
+    @pytest.mark.asyncio
+    async def test_ignores_stale_uid(self, fast_poll) -> None:
+        with patch(
+            "twodo_mcp.server._get_clipboard", new_callable=AsyncMock, return_value=FAKE_UID
+        ):
+            assert await _read_task_uid(previous=FAKE_UID) is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_hex_content(self, fast_poll) -> None:
+        with patch(
+            "twodo_mcp.server._get_clipboard", new_callable=AsyncMock, return_value="z" * 32
+        ):
+            assert await _read_task_uid() is None
+
+    @pytest.mark.asyncio
+    async def test_skips_reads_while_change_count_unchanged(self, fast_poll) -> None:
+        with (
+            patch("twodo_mcp.server._clipboard_change_count", return_value=5),
+            patch(
+                "twodo_mcp.server._get_clipboard", new_callable=AsyncMock, return_value=FAKE_UID
+            ) as clipboard,
+        ):
+            assert await _read_task_uid(change_count=5) is None
+            clipboard.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reads_after_change_count_advances(self, fast_poll) -> None:
+        with (
+            patch("twodo_mcp.server._clipboard_change_count", return_value=6),
+            patch("twodo_mcp.server._get_clipboard", new_callable=AsyncMock, return_value=FAKE_UID),
+        ):
+            assert await _read_task_uid(change_count=5) == FAKE_UID
+
+
 class TestAddTask:
     @pytest.mark.asyncio
     async def test_success(self, mock_open_url_success, mock_clipboard_uid) -> None:
@@ -91,6 +172,313 @@ class TestAddTask:
         assert result["uid"] is None
 
 
+@pytest.fixture
+def mock_bulk_unavailable():
+    """Mock _open_urls_bulk as unavailable so batches use per-URL opens."""
+    with patch("twodo_mcp.server._open_urls_bulk", new_callable=AsyncMock, return_value=None) as m:
+        yield m
+
+
+class TestOpenUrlAndReadUid:
+    """Tests for the single-osascript open+UID-read helper."""
+
+    @pytest.fixture(autouse=True)
+    def mock_osascript_unavailable(self):
+        """Override the module-wide mock: these tests exercise the real helper."""
+        return
+
+    @pytest.mark.asyncio
+    async def test_returns_uid_from_stdout(self) -> None:
+        from twodo_mcp.server import _open_url_and_read_uid
+
+        with patch(
+            "twodo_mcp.server._run_command",
+            new_callable=AsyncMock,
+            return_value=(0, FAKE_UID, ""),
+        ):
+            assert await _open_url_and_read_uid("twodo://a") == (True, FAKE_UID)
+
+    @pytest.mark.asyncio
+    async def test_opened_but_no_uid(self) -> None:
+        from twodo_mcp.server import _open_url_and_read_uid
+
+        with patch(
+            "twodo_mcp.server._run_command", new_callable=AsyncMock, return_value=(0, "", "")
+        ):
+            assert await _open_url_and_read_uid("twodo://a") == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_osascript_missing(self) -> None:
+        from twodo_mcp.server import _open_url_and_read_uid
+
+        with patch(
+            "twodo_mcp.server._run_command",
+            new_callable=AsyncMock,
+            side_effect=FileNotFoundError,
+        ):
+            assert await _open_url_and_read_uid("twodo://a") is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_a_hard_outcome_not_a_fallback(self) -> None:
+        import asyncio
+
+        from twodo_mcp.server import _open_url_and_read_uid
+
+        # The script opens the URL before polling, so a timeout must not
+        # return the fall-back sentinel that re-dispatches the URL.
+        with patch(
+            "twodo_mcp.server._run_command",
+            new_callable=AsyncMock,
+            side_effect=asyncio.TimeoutError,
+        ):
+            assert await _open_url_and_read_uid("twodo://a") == (False, None)
+
+
+class TestAddMultipleTasks:
+    @pytest.mark.asyncio
+    async def test_all_succeed(self, mock_bulk_unavailable, mock_open_url_success) -> None:
+        params = AddMultipleTasksInput(tasks=["A", "B", "C"])
+        result = await twodo_add_multiple_tasks(params, AsyncMock())
+
+        assert result["success"] is True
+        assert result["total"] == 3
+        assert result["successful"] == 3
+        assert result["failed"] == 0
+        assert {r["task"] for r in result["results"]} == {"A", "B", "C"}
+
+    @pytest.mark.asyncio
+    async def test_all_fail(self, mock_bulk_unavailable, mock_open_url_failure) -> None:
+        params = AddMultipleTasksInput(tasks=["A", "B"])
+        result = await twodo_add_multiple_tasks(params, AsyncMock())
+
+        assert result["success"] is False
+        assert result["failed"] == 2
+        assert all(r["error"] for r in result["results"])
+
+    @pytest.mark.asyncio
+    async def test_reports_progress(self, mock_bulk_unavailable, mock_open_url_success) -> None:
+        ctx = AsyncMock()
+        params = AddMultipleTasksInput(tasks=["A", "B"])
+        await twodo_add_multiple_tasks(params, ctx)
+        ctx.report_progress.assert_awaited_with(2, 2)
+
+    @pytest.mark.asyncio
+    async def test_aborts_after_consecutive_failures(
+        self, mock_bulk_unavailable, mock_open_url_failure
+    ) -> None:
+        params = AddMultipleTasksInput(tasks=[f"T{i}" for i in range(10)], concurrency=1)
+        result = await twodo_add_multiple_tasks(params, AsyncMock())
+
+        assert result["success"] is False
+        assert result["failed"] == 10
+        assert any("aborted" in (r["error"] or "") for r in result["results"])
+        # Not every task should have been dispatched.
+        assert mock_open_url_failure.await_count < 10
+
+    @pytest.mark.asyncio
+    async def test_bulk_path(self) -> None:
+        statuses = [(True, "OK"), (False, "'open' command failed in 2Do batch")]
+        with patch(
+            "twodo_mcp.server._open_urls_bulk", new_callable=AsyncMock, return_value=statuses
+        ):
+            params = AddMultipleTasksInput(tasks=["A", "B"])
+            result = await twodo_add_multiple_tasks(params, AsyncMock())
+
+        assert result["successful"] == 1
+        assert result["failed"] == 1
+
+
+class TestPacer:
+    @pytest.mark.asyncio
+    async def test_spaces_out_dispatches(self) -> None:
+        import time
+
+        from twodo_mcp.server import _Pacer
+
+        pacer = _Pacer(min_interval=0.02)
+        start = time.monotonic()
+        for _ in range(3):
+            await pacer.wait()
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_first_wait_is_immediate(self) -> None:
+        import time
+
+        from twodo_mcp.server import _Pacer
+
+        pacer = _Pacer(min_interval=1.0)
+        start = time.monotonic()
+        await pacer.wait()
+        assert time.monotonic() - start < 0.5
+
+
+class TestBatchJobs:
+    @pytest.mark.asyncio
+    async def test_submit_and_poll(self, mock_bulk_unavailable, mock_open_url_success) -> None:
+        from twodo_mcp.server import (
+            JobStatusInput,
+            twodo_add_multiple_tasks_submit,
+            twodo_job_status,
+        )
+
+        params = AddMultipleTasksInput(tasks=["A", "B"])
+        submitted = await twodo_add_multiple_tasks_submit(params)
+
+        assert submitted["success"] is True
+        assert submitted["total"] == 2
+
+        from twodo_mcp.server import _JOBS
+
+        await _JOBS[submitted["job_id"]]["task"]
+        status = await twodo_job_status(JobStatusInput(job_id=submitted["job_id"]))
+
+        assert status["done"] is True
+        assert status["completed"] == 2
+        assert status["successful"] == 2
+        assert status["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_oldest_finished_jobs_are_evicted(
+        self, mock_bulk_unavailable, mock_open_url_success
+    ) -> None:
+        from twodo_mcp.server import _JOBS, twodo_add_multiple_tasks_submit
+
+        with patch("twodo_mcp.server.MAX_FINISHED_JOBS", 1):
+            first = await twodo_add_multiple_tasks_submit(AddMultipleTasksInput(tasks=["A"]))
+            await _JOBS[first["job_id"]]["task"]
+            second = await twodo_add_multiple_tasks_submit(AddMultipleTasksInput(tasks=["B"]))
+            await _JOBS[second["job_id"]]["task"]
+            third = await twodo_add_multiple_tasks_submit(AddMultipleTasksInput(tasks=["C"]))
+            await _JOBS[third["job_id"]]["task"]
+
+        # Submitting the third job pushes the first finished job past the cap.
+        assert first["job_id"] not in _JOBS
+        assert second["job_id"] in _JOBS
+        assert third["job_id"] in _JOBS
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_id(self) -> None:
+        from twodo_mcp.server import JobStatusInput, twodo_job_status
+
+        result = await twodo_job_status(JobStatusInput(job_id="nope"))
+        assert result["success"] is False
+        assert "Unknown job ID" in result["error"]
+
+
+class TestLauncher:
+    @pytest.mark.asyncio
+    async def test_reads_status_from_coprocess(self) -> None:
+        from twodo_mcp.server import _Launcher
+
+        launcher = _Launcher()
+        with patch.object(_Launcher, "_SCRIPT", 'while IFS= read -r u; do echo OK; done'):
+            result = await launcher.open_url("twodo://a")
+        assert result == (True, "OK")
+        assert launcher._proc is not None
+        launcher._proc.stdin.close()
+        await launcher._proc.wait()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_shell_missing(self) -> None:
+        from twodo_mcp.server import _Launcher
+
+        launcher = _Launcher()
+        with patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError):
+            assert await launcher.open_url("twodo://a") is None
+        assert launcher._broken is True
+
+    @pytest.mark.asyncio
+    async def test_post_write_timeout_is_a_hard_result(self) -> None:
+        from twodo_mcp.server import _Launcher
+
+        launcher = _Launcher()
+        # A coprocess that swallows the URL and never answers; the URL was
+        # written, so a timeout must not trigger the one-shot fallback.
+        with (
+            patch.object(_Launcher, "_SCRIPT", "while IFS= read -r u; do read -r _wait; done"),
+            patch("twodo_mcp.server.URL_TIMEOUT_SECONDS", 0.05),
+        ):
+            await launcher._ensure_started()
+            proc = launcher._proc
+            result = await launcher.open_url("twodo://a")
+        assert result is not None
+        assert result[0] is False
+        assert "outcome unknown" in result[1]
+        assert launcher._proc is None
+        assert proc is not None
+        await proc.wait()
+
+    @pytest.mark.asyncio
+    async def test_cancellation_drops_coprocess(self) -> None:
+        import asyncio
+
+        from twodo_mcp.server import _Launcher
+
+        launcher = _Launcher()
+        # A coprocess that swallows the URL and never answers, so open_url
+        # blocks on readline (no grandchildren that could outlive the kill).
+        with patch.object(_Launcher, "_SCRIPT", "while IFS= read -r u; do read -r _wait; done"):
+            task = asyncio.create_task(launcher.open_url("twodo://a"))
+            await asyncio.sleep(0.05)
+            proc = launcher._proc
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        # The unread status line would desync every later request by one
+        # line, so the coprocess must be dropped, not reused.
+        assert launcher._proc is None
+        assert proc is not None
+        await proc.wait()
+
+
+class TestOpenUrlsBulk:
+    @pytest.mark.asyncio
+    async def test_parses_status_lines(self) -> None:
+        from twodo_mcp.server import _open_urls_bulk
+
+        with patch(
+            "twodo_mcp.server._run_command",
+            new_callable=AsyncMock,
+            return_value=(0, "OK\nERR", ""),
+        ):
+            statuses = await _open_urls_bulk(["twodo://a", "twodo://b"])
+
+        assert statuses is not None
+        assert statuses[0][0] is True
+        assert statuses[1][0] is False
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_osascript_missing(self) -> None:
+        from twodo_mcp.server import _open_urls_bulk
+
+        with patch(
+            "twodo_mcp.server._run_command",
+            new_callable=AsyncMock,
+            side_effect=FileNotFoundError,
+        ):
+            assert await _open_urls_bulk(["twodo://a"]) is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_a_hard_result_not_a_fallback(self) -> None:
+        import asyncio
+
+        from twodo_mcp.server import _open_urls_bulk
+
+        with patch(
+            "twodo_mcp.server._run_command",
+            new_callable=AsyncMock,
+            side_effect=asyncio.TimeoutError,
+        ):
+            statuses = await _open_urls_bulk(["twodo://a", "twodo://b"])
+
+        # The killed osascript may have opened some URLs already, so a
+        # timeout must not trigger the per-URL re-dispatch fallback.
+        assert statuses is not None
+        assert all(ok is False for ok, _ in statuses)
+        assert all("outcome unknown" in msg for _, msg in statuses)
+
+
 class TestGetTaskID:
     @pytest.mark.asyncio
     async def test_success(self, mock_open_url_success, mock_clipboard_uid) -> None:
@@ -120,7 +508,9 @@ class TestGetTaskID:
 class TestPasteTasks:
     @pytest.mark.asyncio
     async def test_success(self, mock_open_url_success) -> None:
-        params = PasteTasksInput(text="Line 1\nLine 2\nLine 3", in_project="Shopping", for_list="Home")
+        params = PasteTasksInput(
+            text="Line 1\nLine 2\nLine 3", in_project="Shopping", for_list="Home"
+        )
         result = await twodo_paste_tasks(params)
 
         assert result["success"] is True
@@ -1,11 +1,14 @@
 """Tests for URL building logic — no 2Do app required."""
 
 from twodo_mcp.server import (
+    AddMultipleTasksInput,
     AddTaskInput,
     Priority,
     RepeatInterval,
     TaskType,
     _build_add_url,
+    _build_add_url_tail,
+    _qfast,
 )
 
 TWODO_BASE = "twodo://x-callback-url/add?"
@@ -161,3 +164,39 @@ class TestBuildAddUrl:
         params = AddTaskInput(task="Task with & and = signs", save_in_clipboard=False)
         url = _build_add_url(params)
         assert "task=Task%20with%20%26%20and%20%3D%20signs" in url
+
+
+class TestBuildAddUrlTail:
+    """Tests for _build_add_url_tail()."""
+
+    def test_no_shared_fields(self) -> None:
+        params = AddMultipleTasksInput(tasks=["A"])
+        assert _build_add_url_tail(params) == ""
+
+    def test_all_shared_fields(self) -> None:
+        params = AddMultipleTasksInput(
+            tasks=["A"],
+            for_list="My List",
+            priority=Priority.HIGH,
+            tags="work,urgent",
+            due="2026-03-01",
+        )
+        tail = _build_add_url_tail(params)
+        assert tail == "forlist=My%20List&priority=3&tags=work%2Curgent&due=2026-03-01"
+
+    def test_default_priority_omitted(self) -> None:
+        params = AddMultipleTasksInput(tasks=["A"], for_list="Work")
+        assert _build_add_url_tail(params) == "forlist=Work"
+
+
+class TestQfast:
+    """Tests for the _qfast() ASCII fast path."""
+
+    def test_plain_text_matches_quote(self) -> None:
+        assert _qfast("Buy milk at 9.30") == "Buy%20milk%20at%209.30"
+
+    def test_reserved_chars_fall_back(self) -> None:
+        assert _qfast("a&b=c") == "a%26b%3Dc"
+
+    def test_non_ascii_falls_back(self) -> None:
+        assert _qfast("café") == "caf%C3%A9"